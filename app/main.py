@@ -1,30 +1,34 @@
 import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Depends, HTTPException, BackgroundTasks
+from typing import List
+from fastapi import FastAPI, Depends, HTTPException
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
-from app.core.database import get_db, engine, Base, AsyncSessionLocal
+from app.core.config import settings
+from app.core.database import get_db, engine, Base
 from app.models.origin import TargetOrigin
 from app.services.scraper_service import ScraperService
+from app.services.origin_registry import OriginRegistry
+from app.services.scrape_queue import ScrapeQueue
 from app.schemas.scrape import DateRangeRequest
+from app.schemas.origin import OriginCreate, OriginUpdate, OriginResponse
 
 # Scheduler Setup
 scheduler = AsyncIOScheduler()
 scraper_service = ScraperService()
 
 async def run_scraper_job(origin_id: int):
-    async with AsyncSessionLocal() as session:
-        stmt = select(TargetOrigin).where(TargetOrigin.id == origin_id)
-        result = await session.execute(stmt)
-        origin = result.scalar_one_or_none()
+    origin = origin_registry.get(origin_id)
 
-        if origin:
-            print(f"Starting job for {origin.name}")
-            await scraper_service.scrape(origin, session)
-            print(f"Finished job for {origin.name}")
+    if origin and origin.enabled:
+        await scrape_queue.submit_poll(origin)
+
+origin_registry = OriginRegistry(scheduler, run_scraper_job)
+scrape_queue = ScrapeQueue(scraper_service, origin_registry.get, workers=settings.SCRAPE_WORKERS)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,34 +37,72 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
 
     # Load jobs
-    async with AsyncSession(engine) as session:
-        stmt = select(TargetOrigin)
-        result = await session.execute(stmt)
-        origins = result.scalars().all()
-
-        for origin in origins:
-            scheduler.add_job(
-                run_scraper_job,
-                IntervalTrigger(minutes=origin.scrap_interval),
-                id=str(origin.id),
-                args=[origin.id],
-                replace_existing=True
-            )
-            print(f"Scheduled job for {origin.name} every {origin.scrap_interval} minutes")
+    await origin_registry.refresh(force=True)
+    scheduler.add_job(
+        origin_registry.refresh,
+        IntervalTrigger(seconds=settings.ORIGIN_REFRESH_INTERVAL),
+        id="origin-registry-refresh",
+        replace_existing=True
+    )
 
+    scrape_queue.start()
     scheduler.start()
     yield
     # Shutdown
     scheduler.shutdown()
+    await scrape_queue.stop()
 
 app = FastAPI(title="UOS Scraper", lifespan=lifespan)
 
+def get_origin_or_404(origin_id: int) -> TargetOrigin:
+    origin = origin_registry.get(origin_id)
+    if not origin:
+        raise HTTPException(status_code=404, detail="Origin not found")
+    return origin
+
+def get_enabled_origin(origin_id: int) -> TargetOrigin:
+    origin = get_origin_or_404(origin_id)
+    if not origin.enabled:
+        raise HTTPException(status_code=409, detail="Origin is disabled")
+    return origin
+
+async def ensure_code_available(code: str, db: AsyncSession, origin_id: int | None = None):
+    stmt = select(TargetOrigin.id).where(TargetOrigin.code == code)
+    if origin_id is not None:
+        stmt = stmt.where(TargetOrigin.id != origin_id)
+    result = await db.execute(stmt)
+    if result.first():
+        raise HTTPException(status_code=409, detail="Origin code already exists")
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
 
-@app.post("/api/v1/origins/{origin_id}/scrape")
-async def trigger_scrape(origin_id: int, background_tasks: BackgroundTasks, db: AsyncSession = Depends(get_db)):
+@app.get("/api/v1/origins", response_model=List[OriginResponse])
+async def list_origins():
+    return origin_registry.all()
+
+@app.get("/api/v1/origins/{origin_id}", response_model=OriginResponse)
+async def get_origin(origin_id: int):
+    return get_origin_or_404(origin_id)
+
+@app.post("/api/v1/origins", response_model=OriginResponse, status_code=201)
+async def create_origin(request: OriginCreate, db: AsyncSession = Depends(get_db)):
+    await ensure_code_available(request.code, db)
+
+    origin = TargetOrigin(**request.model_dump())
+    db.add(origin)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Origin conflicts with existing data")
+
+    await origin_registry.refresh(force=True)
+    return get_origin_or_404(origin.id)
+
+@app.patch("/api/v1/origins/{origin_id}", response_model=OriginResponse)
+async def update_origin(origin_id: int, request: OriginUpdate, db: AsyncSession = Depends(get_db)):
     stmt = select(TargetOrigin).where(TargetOrigin.id == origin_id)
     result = await db.execute(stmt)
     origin = result.scalar_one_or_none()
@@ -68,15 +110,25 @@ async def trigger_scrape(origin_id: int, background_tasks: BackgroundTasks, db:
     if not origin:
         raise HTTPException(status_code=404, detail="Origin not found")
 
-    background_tasks.add_task(run_scraper_job, origin.id)
-    return {"message": "Scraping triggered in background"}
-
-@app.post("/api/v1/origins/{origin_id}/scrape-range")
-async def scrape_range(
-    origin_id: int,
-    request: DateRangeRequest,
-    db: AsyncSession = Depends(get_db)
-):
+    changes = request.model_dump(exclude_unset=True)
+    if "code" in changes:
+        await ensure_code_available(changes["code"], db, origin_id)
+
+    for field, value in changes.items():
+        setattr(origin, field, value)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Origin conflicts with existing data")
+
+    await origin_registry.refresh(force=True)
+    if changes.get("enabled") is False:
+        await scrape_queue.cancel_origin(origin_id)
+    return get_origin_or_404(origin_id)
+
+@app.delete("/api/v1/origins/{origin_id}", status_code=204)
+async def delete_origin(origin_id: int, db: AsyncSession = Depends(get_db)):
     stmt = select(TargetOrigin).where(TargetOrigin.id == origin_id)
     result = await db.execute(stmt)
     origin = result.scalar_one_or_none()
@@ -84,11 +136,38 @@ async def scrape_range(
     if not origin:
         raise HTTPException(status_code=404, detail="Origin not found")
 
-    count = await scraper_service.scrape_range(
+    await db.delete(origin)
+    await db.commit()
+
+    await origin_registry.refresh(force=True)
+    await scrape_queue.cancel_origin(origin_id)
+
+@app.get("/api/v1/scrape-queue")
+async def scrape_queue_stats():
+    return scrape_queue.stats()
+
+@app.post("/api/v1/origins/{origin_id}/scrape")
+async def trigger_scrape(origin_id: int):
+    origin = get_enabled_origin(origin_id)
+
+    await scrape_queue.submit_poll(origin)
+    return {"message": "Scraping queued in background"}
+
+@app.post("/api/v1/origins/{origin_id}/scrape-range")
+async def scrape_range(origin_id: int, request: DateRangeRequest):
+    origin = get_enabled_origin(origin_id)
+
+    future = await scrape_queue.submit_backfill(
         origin=origin,
         start_page=request.start_page,
         start_date=request.start_date,
-        end_date=request.end_date,
-        db=db
+        end_date=request.end_date
     )
+    # Shield so a dropped request does not cancel a backfill other callers may have joined
+    try:
+        count = await asyncio.shield(future)
+    except asyncio.CancelledError:
+        if not future.cancelled():
+            raise
+        raise HTTPException(status_code=409, detail="Backfill cancelled because the origin was disabled or deleted")
     return {"message": f"Scraped {count} items between {request.start_date} and {request.end_date}"}
@@ -1,6 +1,6 @@
 from datetime import datetime
 import enum
-from sqlalchemy import String, Integer, DateTime, Enum
+from sqlalchemy import String, Integer, BigInteger, DateTime, Enum, Boolean, func
 from sqlalchemy.orm import Mapped, mapped_column
 from app.core.database import Base
 
@@ -21,3 +21,12 @@ class TargetOrigin(Base):
     board: Mapped[str] = mapped_column(String, nullable=False)
     major: Mapped[str | None] = mapped_column(String, nullable=True)
     last_scraped_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+    enabled: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False) # Set by trigger
+
+class TargetOriginVersion(Base):
+    __tablename__ = "target_origins_version"
+
+    # Single row bumped by a statement-level trigger on target_origins (see init.sql)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
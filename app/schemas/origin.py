@@ -0,0 +1,49 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from app.models.origin import ScraperType
+
+class OriginCreate(BaseModel):
+    code: str
+    name: str
+    target_url: str
+    scraper_type: ScraperType
+    scrap_interval: int = Field(gt=0)  # Minutes
+    board: str
+    major: Optional[str] = None
+    enabled: bool = True
+
+
+class OriginUpdate(BaseModel):
+    code: Optional[str] = None
+    name: Optional[str] = None
+    target_url: Optional[str] = None
+    scraper_type: Optional[ScraperType] = None
+    scrap_interval: Optional[int] = Field(default=None, gt=0)
+    board: Optional[str] = None
+    major: Optional[str] = None
+    enabled: Optional[bool] = None
+
+    @field_validator("code", "name", "target_url", "scraper_type", "scrap_interval", "board", "enabled")
+    @classmethod
+    def reject_null(cls, value):
+        # Fields may be omitted, but only major may be explicitly cleared
+        if value is None:
+            raise ValueError("field cannot be null")
+        return value
+
+
+class OriginResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    code: str
+    name: str
+    target_url: str
+    scraper_type: ScraperType
+    scrap_interval: int
+    board: str
+    major: Optional[str] = None
+    enabled: bool
+    last_scraped_at: Optional[datetime] = None
+    updated_at: datetime
@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from datetime import date
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from pydantic import BaseModel
 
-class ScrapedItem(BaseModel):
+@dataclass(slots=True)
+class ScrapedItem:
+    # Internal list row, not an API model; slots keep per-row overhead low
     id: str
     url: str
     date: date
@@ -17,8 +20,8 @@ class ScrapedDetail(BaseModel):
 
 class BaseScraper(ABC):
     @abstractmethod
-    async def parse_list(self, html: str, base_url: str) -> List[ScrapedItem]:
-        """Parse the list page HTML and return a list of items."""
+    def parse_list(self, html: str, base_url: str) -> Iterator[ScrapedItem]:
+        """Parse the list page HTML and yield its items in page order."""
         pass
 
     @abstractmethod
@@ -1,13 +1,12 @@
-from typing import List
+from typing import Iterator
 from datetime import datetime
 from bs4 import BeautifulSoup, Comment
 from app.scrapers.base import BaseScraper, ScrapedItem, ScrapedDetail
 import re
 
 class CommonScraper(BaseScraper):
-    async def parse_list(self, html: str, base_url: str) -> List[ScrapedItem]:
+    def parse_list(self, html: str, base_url: str) -> Iterator[ScrapedItem]:
         soup = BeautifulSoup(html, "html.parser")
-        items = []
 
         # Selector based on UOS common list pattern
         rows = soup.select(".content-area #contents ul.brd-lstp1 li")
@@ -39,18 +38,16 @@ class CommonScraper(BaseScraper):
                 parsed_date = datetime.strptime(date_str.replace(".", "-"), "%Y-%m-%d").date()
                 view_count = int(spans[2].text.strip())
 
-                items.append(ScrapedItem(
+                yield ScrapedItem(
                     id=seq,
                     url=view_url,
                     date=parsed_date,
                     view_count=view_count,
-                ))
+                )
             except Exception as e:
                 print(f"Error parsing row: {e}")
                 raise e
 
-        return items
-
     async def parse_detail(self, html: str) -> ScrapedDetail:
         soup = BeautifulSoup(html, "html.parser")
 
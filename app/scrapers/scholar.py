@@ -1,13 +1,12 @@
-from typing import List
+from typing import Iterator
 from datetime import datetime, date
 from bs4 import BeautifulSoup, Comment
 from app.scrapers.base import BaseScraper, ScrapedItem, ScrapedDetail
 import re
 
 class ScholarScraper(BaseScraper):
-    async def parse_list(self, html: str, base_url: str) -> List[ScrapedItem]:
+    def parse_list(self, html: str, base_url: str) -> Iterator[ScrapedItem]:
         soup = BeautifulSoup(html, "html.parser")
-        items = []
 
         rows = soup.select("div#subConWarp form table tbody tr")
         print(f"Found {len(rows)} rows in HTML")
@@ -31,18 +30,16 @@ class ScholarScraper(BaseScraper):
                 parsed_date = datetime.strptime(date, "%Y%m%d").date()
                 view_count = int(row.select_one("td:nth-child(5)").get_text(strip=True))
 
-                items.append(ScrapedItem(
+                yield ScrapedItem(
                     id=display_id,
                     url=view_url,
                     date=parsed_date,
                     view_count=view_count,
-                ))
+                )
             except Exception as e:
                 print(f"Error parsing row: {e}")
                 raise e
 
-        return items
-
     async def parse_detail(self, html: str) -> ScrapedDetail:
         soup = BeautifulSoup(html, "html.parser")
 
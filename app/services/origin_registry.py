@@ -0,0 +1,93 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from sqlalchemy import select
+from apscheduler.schedulers.base import BaseScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+from app.core.database import AsyncSessionLocal
+from app.models.origin import TargetOrigin, TargetOriginVersion
+
+class OriginRegistry:
+    def __init__(self, scheduler: BaseScheduler, job_func: Callable[[int], Awaitable[Any]]):
+        """
+        In-memory cache of target origins that keeps the scheduler jobs in sync with the database.
+
+        Args:
+            scheduler: Scheduler the per-origin scrape jobs are registered on.
+            job_func: Coroutine function scheduled for each enabled origin, called with the origin id.
+        """
+        self.scheduler = scheduler
+        self.job_func = job_func
+        self._origins: Dict[int, TargetOrigin] = {}
+        self._intervals: Dict[int, int] = {}
+        self._version: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    def get(self, origin_id: int) -> Optional[TargetOrigin]:
+        return self._origins.get(origin_id)
+
+    def all(self) -> List[TargetOrigin]:
+        return sorted(self._origins.values(), key=lambda origin: origin.id)
+
+    async def refresh(self, force: bool = False) -> bool:
+        """
+        Reload origins if the table changed since the last load, then reconcile scheduler jobs.
+
+        The change check only reads the target_origins_version counter, which a trigger bumps in
+        the same transaction as every write, so it is cheap enough to run every few seconds and
+        never misses a commit regardless of clocks or transaction length.
+
+        Args:
+            force: Reload even if the version did not change (e.g. right after a write through the API).
+
+        Returns:
+            True if origins were reloaded.
+        """
+        async with self._lock:
+            async with AsyncSessionLocal() as session:
+                stmt = select(TargetOriginVersion.version).where(TargetOriginVersion.id == 1)
+                version = (await session.execute(stmt)).scalar_one_or_none()
+
+                if not force and version == self._version:
+                    return False
+
+                result = await session.execute(select(TargetOrigin))
+                origins = result.scalars().all()
+
+            self._origins = {origin.id: origin for origin in origins}
+            self._version = version
+            self._reconcile()
+            return True
+
+    def _reconcile(self):
+        """Add, reschedule or remove scheduler jobs so they match the cached origins."""
+        for origin_id in list(self._intervals):
+            origin = self._origins.get(origin_id)
+            if origin is None or not origin.enabled:
+                job = self.scheduler.get_job(str(origin_id))
+                if job:
+                    job.remove()
+                del self._intervals[origin_id]
+                print(f"Removed job for origin {origin_id}")
+
+        for origin in self._origins.values():
+            if not origin.enabled:
+                continue
+
+            current = self._intervals.get(origin.id)
+            if current == origin.scrap_interval:
+                continue
+
+            if current is None:
+                self.scheduler.add_job(
+                    self.job_func,
+                    IntervalTrigger(minutes=origin.scrap_interval),
+                    id=str(origin.id),
+                    args=[origin.id],
+                    replace_existing=True
+                )
+                print(f"Scheduled job for {origin.name} every {origin.scrap_interval} minutes")
+            else:
+                self.scheduler.reschedule_job(str(origin.id), trigger=IntervalTrigger(minutes=origin.scrap_interval))
+                print(f"Rescheduled job for {origin.name} every {origin.scrap_interval} minutes")
+
+            self._intervals[origin.id] = origin.scrap_interval
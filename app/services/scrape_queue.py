@@ -0,0 +1,266 @@
+import asyncio
+import enum
+import itertools
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+from app.core.database import AsyncSessionLocal
+from app.models.origin import TargetOrigin
+from app.services.scraper_service import ScraperService
+
+class ScrapePriority(enum.IntEnum):
+    POLL = 0      # Fresh-notice polls (scheduled or manual)
+    BACKFILL = 1  # Date range backfill pages
+
+# A step runs one unit of work and returns (done, result); unfinished tasks are re-queued.
+ScrapeStep = Callable[[], Awaitable[Tuple[bool, Any]]]
+
+@dataclass
+class ScrapeTask:
+    origin_id: int
+    priority: ScrapePriority
+    key: Tuple
+    step: ScrapeStep
+    future: asyncio.Future
+    seq: int
+    join_running: bool = False  # Whether new triggers may join this task once it has started
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    steps: int = 0
+    cancelled: bool = False  # Set by cancel_origin while running; the task is not re-queued
+
+class ScrapeQueue:
+    def __init__(
+        self,
+        scraper_service: ScraperService,
+        origin_lookup: Callable[[int], Optional[TargetOrigin]],
+        workers: int = 1,
+        wait_samples: int = 100
+    ):
+        """
+        Central queue for scrape work with per-origin mutual exclusion and priorities.
+
+        Work for an origin never overlaps with other work for the same origin. A poll trigger joins
+        an identical poll that is still queued; if that poll is already running, at most one
+        follow-up poll is queued so notices posted after its fetch are not missed. Backfill triggers
+        join an identical backfill whether it is queued or in progress. Backfills run one list page
+        per step and are re-queued between pages, so polls submitted meanwhile go ahead of the
+        remaining backfill pages. Every step looks the origin up again, so edits apply to queued
+        work and a disabled or deleted origin stops at its next step.
+
+        Args:
+            scraper_service: Service that performs the actual scraping.
+            origin_lookup: Returns the current origin for an id, or None if it no longer exists.
+            workers: Number of concurrent workers. All workers share the scraper's rate-limited
+                client, so a single worker keeps the host budget strictly in priority order.
+            wait_samples: Number of recent wait times kept per priority for the stats.
+        """
+        self.scraper_service = scraper_service
+        self.origin_lookup = origin_lookup
+        self.workers = workers
+        self._pending: List[ScrapeTask] = []
+        self._running: Dict[int, ScrapeTask] = {}
+        self._tasks: Dict[Tuple, ScrapeTask] = {}
+        self._waits: Dict[ScrapePriority, Deque[float]] = {
+            priority: deque(maxlen=wait_samples) for priority in ScrapePriority
+        }
+        self._seq = itertools.count()
+        self._condition = asyncio.Condition()
+        self._worker_tasks: List[asyncio.Task] = []
+
+    def start(self):
+        for i in range(self.workers):
+            self._worker_tasks.append(asyncio.create_task(self._worker(), name=f"scrape-worker-{i}"))
+
+    async def stop(self):
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks.clear()
+
+        for task in [*self._pending, *self._running.values()]:
+            task.future.cancel()
+        self._pending.clear()
+        self._running.clear()
+        self._tasks.clear()
+
+    async def submit_poll(self, origin: TargetOrigin) -> asyncio.Future:
+        """Queue a fresh-notice poll. Resolves to the number of scraped items."""
+        origin_id = origin.id
+
+        async def step():
+            origin = self._current_origin(origin_id)
+            if origin is None:
+                return True, 0
+
+            async with AsyncSessionLocal() as session:
+                print(f"Starting job for {origin.name}")
+                count = await self.scraper_service.scrape(origin, session)
+                print(f"Finished job for {origin.name}")
+            return True, count
+
+        return await self._submit(origin_id, ScrapePriority.POLL, (origin_id, "poll"), step)
+
+    async def submit_backfill(self, origin: TargetOrigin, start_page: int, start_date: date, end_date: date) -> asyncio.Future:
+        """Queue a date range backfill, one page per step. Resolves to the number of scraped items."""
+        origin_id = origin.id
+        state = {"page": start_page, "count": 0}
+
+        async def step():
+            origin = self._current_origin(origin_id)
+            if origin is None:
+                return True, state["count"]
+
+            if state["page"] == start_page:
+                print(f"Scraping range: {start_date} ~ {end_date} for {origin.name}")
+
+            async with AsyncSessionLocal() as session:
+                count, done = await self.scraper_service.scrape_range_page(
+                    origin, state["page"], start_date, end_date, session
+                )
+            state["count"] += count
+            state["page"] += 1
+            return done, state["count"]
+
+        key = (origin_id, "backfill", start_page, start_date, end_date)
+        return await self._submit(origin_id, ScrapePriority.BACKFILL, key, step, join_running=True)
+
+    def _current_origin(self, origin_id: int) -> Optional[TargetOrigin]:
+        origin = self.origin_lookup(origin_id)
+        if origin is None or not origin.enabled:
+            print(f"Origin {origin_id} is deleted or disabled, skipping queued work")
+            return None
+        return origin
+
+    async def cancel_origin(self, origin_id: int) -> int:
+        """
+        Cancel all queued work for an origin.
+
+        Pending tasks are dropped and their futures cancelled. A task that is running finishes its
+        current step; a backfill is then not re-queued and its future is cancelled.
+
+        Returns:
+            Number of tasks cancelled.
+        """
+        async with self._condition:
+            cancelled = [task for task in self._pending if task.origin_id == origin_id]
+            running = self._running.get(origin_id)
+            if running:
+                running.cancelled = True
+                cancelled.append(running)
+
+            for task in cancelled:
+                if task in self._pending:
+                    self._pending.remove(task)
+                    task.future.cancel()
+                # New triggers must not join work that is being cancelled
+                if self._tasks.get(task.key) is task:
+                    del self._tasks[task.key]
+
+        if cancelled:
+            print(f"Cancelled {len(cancelled)} scrape task(s) for origin {origin_id}")
+        return len(cancelled)
+
+    async def _submit(self, origin_id: int, priority: ScrapePriority, key: Tuple, step: ScrapeStep, join_running: bool = False) -> asyncio.Future:
+        async with self._condition:
+            existing = self._tasks.get(key)
+            if existing and (existing.started_at is None or existing.join_running):
+                print(f"Coalesced scrape trigger {key}")
+                return existing.future
+
+            future = asyncio.get_running_loop().create_future()
+            # Callers may fire and forget; mark failures as retrieved so they are only logged once
+            future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+            task = ScrapeTask(
+                origin_id=origin_id,
+                priority=priority,
+                key=key,
+                step=step,
+                future=future,
+                seq=next(self._seq),
+                join_running=join_running,
+            )
+            # Replaces a running poll under the same key, which then becomes its follow-up
+            self._tasks[key] = task
+            self._pending.append(task)
+            self._condition.notify()
+            return future
+
+    def _next_task(self) -> Optional[ScrapeTask]:
+        """Highest-priority pending task whose origin is not already being scraped."""
+        ready = [task for task in self._pending if task.origin_id not in self._running]
+        if not ready:
+            return None
+        return min(ready, key=lambda task: (task.priority, task.seq))
+
+    async def _worker(self):
+        while True:
+            async with self._condition:
+                task = self._next_task()
+                while task is None:
+                    await self._condition.wait()
+                    task = self._next_task()
+
+                self._pending.remove(task)
+                self._running[task.origin_id] = task
+                task.started_at = time.monotonic()
+                self._waits[task.priority].append(task.started_at - task.enqueued_at)
+
+            done = True
+            try:
+                done, result = await task.step()
+                task.steps += 1
+                if done and not task.future.done():
+                    task.future.set_result(result)
+            except Exception as e:
+                print(f"Scrape task {task.key} failed: {e}")
+                if not task.future.done():
+                    task.future.set_exception(e)
+
+            if task.cancelled and not done:
+                task.future.cancel()
+                done = True
+
+            async with self._condition:
+                del self._running[task.origin_id]
+                task.started_at = None
+                if done:
+                    if self._tasks.get(task.key) is task:
+                        del self._tasks[task.key]
+                else:
+                    task.enqueued_at = time.monotonic()
+                    task.seq = next(self._seq)
+                    self._pending.append(task)
+                # The origin is free again, so tasks blocked on it may now be runnable
+                self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        stats = {
+            "depth": len(self._pending),
+            "running": [
+                {
+                    "origin_id": task.origin_id,
+                    "priority": task.priority.name,
+                    "steps": task.steps,
+                    "running_for": round(now - task.started_at, 3),
+                }
+                for task in self._running.values()
+            ],
+            "priorities": {},
+        }
+
+        for priority in ScrapePriority:
+            pending = [task for task in self._pending if task.priority == priority]
+            waits = self._waits[priority]
+            stats["priorities"][priority.name] = {
+                "depth": len(pending),
+                "oldest_wait": round(max((now - task.enqueued_at for task in pending), default=0.0), 3),
+                "avg_wait": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "max_wait": round(max(waits), 3) if waits else 0.0,
+            }
+
+        return stats
@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Callable, List, Optional, Tuple
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.origin import TargetOrigin, ScraperType
@@ -32,30 +33,39 @@ class ScraperService:
             # Add other scrapers here
         }
 
-    async def _fetch_items_generator(self, origin: TargetOrigin, start_page: int = 1):
+    async def _fetch_page(
+        self,
+        origin: TargetOrigin,
+        page: int,
+        stop: Optional[Callable[[ScrapedItem], bool]] = None
+    ) -> Tuple[List[ScrapedItem], Optional[ScrapedItem]]:
         """
-        Yields items from the target URL, handling pagination.
+        Fetches a single list page and parses it up to the first item matching stop.
+
+        Items are collected before returning so the parsed DOM is released before the caller's
+        per-item detail fetches, each of which waits on the rate limiter.
+        Returns the collected items and the item that stopped parsing, if any.
         """
         scraper = self.scrapers.get(origin.scraper_type, self.scrapers[ScraperType.COMMON])
-        page = start_page
-
-        while True:
-            list_url = f"{origin.target_url}&pageIndex={page}"
-            print(f"Fetching URL: {list_url}")
-
-            response = await self.client.get(list_url)
-            response.raise_for_status()
+        list_url = f"{origin.target_url}&pageIndex={page}"
+        print(f"Fetching URL: {list_url}")
 
-            items = await scraper.parse_list(response.text, origin.target_url)
+        response = await self.client.get(list_url)
+        response.raise_for_status()
 
-            if not items:
-                print("No items found on page, stopping.")
-                break
-
-            for item in items:
-                yield item, page
+        items = []
+        stopped_at = None
+        parsed = scraper.parse_list(response.text, origin.target_url)
+        try:
+            for item in parsed:
+                if stop and stop(item):
+                    stopped_at = item
+                    break
+                items.append(item)
+        finally:
+            parsed.close()
 
-            page += 1
+        return items, stopped_at
 
     async def _process_and_save_item(self, origin: TargetOrigin, item: ScrapedItem, scraper: BaseScraper, db: AsyncSession):
         """
@@ -125,33 +135,39 @@ class ScraperService:
         scraper = self.scrapers.get(origin.scraper_type, self.scrapers[ScraperType.COMMON])
         total_scraped = 0
 
-        # Scrape only the first page (or until items run out on first page)
-        async for item, page in self._fetch_items_generator(origin):
-            if page > 1:
-                break
-
+        # Scrape only the first page
+        items, _ = await self._fetch_page(origin, 1)
+        for item in items:
             await self._process_and_save_item(origin, item, scraper, db)
             total_scraped += 1
 
         return total_scraped
 
-    async def scrape_range(self, origin: TargetOrigin, start_page: int, start_date: date, end_date: date, db: AsyncSession):
+    async def scrape_range_page(self, origin: TargetOrigin, page: int, start_date: date, end_date: date, db: AsyncSession) -> Tuple[int, bool]:
+        """
+        Scrapes a single list page of a date range backfill.
+        Returns the number of items scraped and whether the range is exhausted.
+        """
         scraper = self.scrapers.get(origin.scraper_type, self.scrapers[ScraperType.COMMON])
         total_scraped = 0
 
-        print(f"Scraping range: {start_date} ~ {end_date} for {origin.name}")
+        items, older = await self._fetch_page(origin, page, stop=lambda item: item.date < start_date)
+        if not items and older is None:
+            print("No items found on page, stopping.")
+            return total_scraped, True
 
-        async for item, page in self._fetch_items_generator(origin, start_page=start_page):
+        for item in items:
             print(f"Checking item: {origin.code}-{item.id}")
 
-            if item.date < start_date:
-                print(f"Item date {item.date} is older than start date {start_date}, stopping.")
-                break
-            elif item.date > end_date:
+            if item.date > end_date:
                 print(f"Item date {item.date} is newer than end date {end_date}, skipping.")
                 continue
 
             await self._process_and_save_item(origin, item, scraper, db)
             total_scraped += 1
 
-        return total_scraped
+        if older:
+            print(f"Item date {older.date} is older than start date {start_date}, stopping.")
+            return total_scraped, True
+
+        return total_scraped, False
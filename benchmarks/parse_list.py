@@ -0,0 +1,122 @@
+"""
+Before/after benchmark for list parsing.
+
+Before/after sections compare the previous implementation (pydantic ScrapedItem models,
+parse_list returning a full list) against the current one (slotted ScrapedItem records,
+parse_list as a generator). A separate section compares consuming a full page against
+stopping after the first item with the current generator.
+
+Usage:
+    python -m benchmarks.parse_list
+"""
+import contextlib
+import io
+import re
+import time
+import tracemalloc
+from datetime import date, datetime
+from typing import Callable, List, Tuple
+from bs4 import BeautifulSoup
+from pydantic import BaseModel
+from app.scrapers.base import ScrapedItem
+from app.scrapers.common import CommonScraper
+
+BASE_URL = "https://www.uos.ac.kr/korNotice/list.do?list_id=FA1&identified=anonymous"
+
+class PydanticScrapedItem(BaseModel):
+    # ScrapedItem as it was before the switch to a slotted dataclass
+    id: str
+    url: str
+    date: date
+    view_count: int = 0
+
+def legacy_parse_list(html: str, base_url: str) -> List[PydanticScrapedItem]:
+    """CommonScraper.parse_list as it was before: builds the whole page as pydantic models."""
+    soup = BeautifulSoup(html, "html.parser")
+    items = []
+
+    rows = soup.select(".content-area #contents ul.brd-lstp1 li")
+    print(f"Found {len(rows)} rows in HTML")
+
+    for row in rows:
+        display_id = row.select_one("p.num").get_text(strip=True)
+        if "공지" in display_id:
+            continue
+
+        href = row.select_one(".ti").find("a").get("href")
+        seq = re.search(r"fnView\('([^']*)',\s*'([^']*)'\)", href).group(2)
+        view_url = base_url.replace("list.do", "view.do") + f"&seq={seq}"
+
+        spans = row.select_one(".da").find_all("span")
+        parsed_date = datetime.strptime(spans[1].text.strip().replace(".", "-"), "%Y-%m-%d").date()
+        view_count = int(spans[2].text.strip())
+
+        items.append(PydanticScrapedItem(
+            id=seq,
+            url=view_url,
+            date=parsed_date,
+            view_count=view_count,
+        ))
+
+    return items
+
+def build_list_html(rows: int) -> str:
+    items = "".join(
+        f"""
+        <li>
+            <p class="num">{rows - i}</p>
+            <div class="ti"><a href="javascript:fnView('1', '{30000 + i}');">공지 제목 {i}</a></div>
+            <div class="da"><span>작성자</span><span>2025.11.{1 + i % 28:02d}</span><span>{i}</span></div>
+        </li>"""
+        for i in range(rows)
+    )
+    return f'<div class="content-area"><div id="contents"><ul class="brd-lstp1">{items}</ul></div></div>'
+
+def measure(func: Callable[[], object], repeat: int) -> Tuple[float, int]:
+    """Returns (seconds per call, peak bytes allocated during one call)."""
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat, peak
+
+def report(name: str, before: Tuple[float, int], after: Tuple[float, int], labels: Tuple[str, str] = ("before", "after")):
+    print(f"{name}")
+    print(f"  {labels[0] + ':':<12}{before[0] * 1000:9.2f} ms  peak {before[1] / 1024:9.1f} KiB")
+    print(f"  {labels[1] + ':':<12}{after[0] * 1000:9.2f} ms  peak {after[1] / 1024:9.1f} KiB")
+    print(f"  speedup {before[0] / after[0]:.2f}x, memory {before[1] / after[1]:.2f}x")
+
+def bench_items(count: int = 100_000, repeat: int = 5):
+    fields = [(str(i), f"{BASE_URL}&seq={i}", date(2025, 11, 1 + i % 28), i) for i in range(count)]
+
+    before = measure(lambda: [PydanticScrapedItem(id=a, url=b, date=c, view_count=d) for a, b, c, d in fields], repeat)
+    after = measure(lambda: [ScrapedItem(id=a, url=b, date=c, view_count=d) for a, b, c, d in fields], repeat)
+    report(f"Item records ({count} rows)", before, after)
+
+def bench_parse_list(rows: int = 200, repeat: int = 20):
+    scraper = CommonScraper()
+    html = build_list_html(rows)
+
+    # Silence the per-page "Found N rows" logging while timing
+    with contextlib.redirect_stdout(io.StringIO()):
+        before = measure(lambda: legacy_parse_list(html, BASE_URL), repeat)
+        after = measure(lambda: list(scraper.parse_list(html, BASE_URL)), repeat)
+    report(f"parse_list, full page ({rows} rows)", before, after)
+
+def bench_early_stop(rows: int = 200, repeat: int = 20):
+    scraper = CommonScraper()
+    html = build_list_html(rows)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = measure(lambda: list(scraper.parse_list(html, BASE_URL)), repeat)
+        first = measure(lambda: next(scraper.parse_list(html, BASE_URL)), repeat)
+    report(f"Current parse_list, full page vs first item only ({rows} rows)", full, first, ("full page", "early stop"))
+
+if __name__ == "__main__":
+    bench_items()
+    bench_parse_list()
+    bench_early_stop()
@@ -1,22 +1,60 @@
 -- Target Schema Reference
 create table if not exists public.target_origins (
     id bigint generated by default as identity primary key,
-    code varchar(255) not null,
+    code varchar(255) not null unique,
     name varchar(255) not null,
     target_url varchar(255) not null,
     scraper_type varchar(50) not null,
     scrap_interval integer not null,
     board varchar(50) not null,
     major varchar(255),
-    last_scraped_at timestamp
+    last_scraped_at timestamp,
+    enabled boolean not null default true,
+    updated_at timestamp not null default now()
 );
 
+-- Stamp updated_at from the database clock on every insert and update
+create or replace function public.touch_target_origins() returns trigger as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists target_origins_touch on public.target_origins;
+create trigger target_origins_touch
+    before insert or update on public.target_origins
+    for each row execute function public.touch_target_origins();
+
+-- Single-row change counter the origin registry polls. It is bumped inside the writing
+-- transaction, so a change becomes visible to the registry exactly when it commits.
+create table if not exists public.target_origins_version (
+    id integer primary key,
+    version bigint not null default 0
+);
+insert into public.target_origins_version (id, version) values (1, 0) on conflict (id) do nothing;
+
+create or replace function public.bump_target_origins_version() returns trigger as $$
+begin
+    update public.target_origins_version set version = version + 1 where id = 1;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists target_origins_version_bump on public.target_origins;
+create trigger target_origins_version_bump
+    after insert or update or delete or truncate on public.target_origins
+    for each statement execute function public.bump_target_origins_version();
+
 INSERT INTO public.target_origins (id, name, target_url, scraper_type, scrap_interval, board, major, last_scraped_at, code) VALUES (1, '일반', 'https://www.uos.ac.kr/korNotice/list.do?list_id=FA1&menuid=2000005009002000000&identified=anonymous', 'COMMON', 5, 'GENERAL', null, null, 'uos.main.fa1');
 INSERT INTO public.target_origins (id, name, target_url, scraper_type, scrap_interval, board, major, last_scraped_at, code) VALUES (2, '학사', 'https://www.uos.ac.kr/korNotice/list.do?list_id=FA2&menuid=2000005009003000000&identified=anonymous&', 'COMMON', 5, 'ACADEMIC', null, null, 'uos.main.fa2');
 INSERT INTO public.target_origins (id, name, target_url, scraper_type, scrap_interval, board, major, last_scraped_at, code) VALUES (3, '채용', 'https://www.uos.ac.kr/korNotice/list.do?list_id=FA34&menuid=2000005009004000000&identified=anonymous', 'COMMON', 5, 'RECRUIT', null, null, 'uos.main.fa34');
 INSERT INTO public.target_origins (id, name, target_url, scraper_type, scrap_interval, board, major, last_scraped_at, code) VALUES (4, '창업', 'https://www.uos.ac.kr/korColumn/list.do?list_id=FA35&menuid=2000005009005000000&identified=anonymous', 'COMMON', 5, 'ETC', null, null, 'uos.main.fa35');
 INSERT INTO public.target_origins (id, name, target_url, scraper_type, scrap_interval, board, major, last_scraped_at, code) VALUES (5, '장학', 'https://scholarship.uos.ac.kr/scholarship/notice/notice/list.do?brdBbsseq=1&identified=anonymous', 'SCHOLAR', 5, 'SCHOLARSHIP', null, null, 'uos.main.scholarship');
 
+-- Keep the identity sequence ahead of the seeded ids so origins created through the API don't collide
+select setval(pg_get_serial_sequence('public.target_origins', 'id'), coalesce((select max(id) from public.target_origins), 0) + 1, false);
+
 create table if not exists public.announcement (
     id bigint generated by default as identity primary key,
     announcementdetail_id bigint unique,
@@ -0,0 +1,31 @@
+-- Brings a target_origins table created before the origin registry up to date.
+-- Idempotent: safe to run more than once.
+-- Usage: docker-compose exec -T db psql -U root -d scraper < migrations/001_origin_registry.sql
+
+alter table public.target_origins add column if not exists enabled boolean not null default true;
+alter table public.target_origins add column if not exists updated_at timestamp not null default now();
+
+-- Bump updated_at on every change so the origin registry picks up edits made directly in SQL
+create or replace function public.touch_target_origins() returns trigger as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists target_origins_touch on public.target_origins;
+create trigger target_origins_touch
+    before update on public.target_origins
+    for each row execute function public.touch_target_origins();
+
+-- scraping_key is built from the origin code, so codes must be unique (fails if duplicates already exist)
+do $$
+begin
+    if not exists (select 1 from pg_constraint where conname = 'target_origins_code_key') then
+        alter table public.target_origins add constraint target_origins_code_key unique (code);
+    end if;
+end;
+$$;
+
+-- Keep the identity sequence ahead of the seeded ids so origins created through the API don't collide
+select setval(pg_get_serial_sequence('public.target_origins', 'id'), coalesce((select max(id) from public.target_origins), 0) + 1, false);
@@ -0,0 +1,39 @@
+-- Moves the origin registry from max(updated_at) polling to a transactional change counter,
+-- and stamps updated_at from the database clock only. Run after 001_origin_registry.sql.
+-- Idempotent: safe to run more than once.
+-- Usage: docker-compose exec -T db psql -U root -d scraper < migrations/002_origin_registry_version.sql
+
+alter table public.target_origins alter column updated_at set default now();
+
+-- Stamp updated_at from the database clock on every insert and update
+create or replace function public.touch_target_origins() returns trigger as $$
+begin
+    new.updated_at = now();
+    return new;
+end;
+$$ language plpgsql;
+
+drop trigger if exists target_origins_touch on public.target_origins;
+create trigger target_origins_touch
+    before insert or update on public.target_origins
+    for each row execute function public.touch_target_origins();
+
+-- Single-row change counter the origin registry polls. It is bumped inside the writing
+-- transaction, so a change becomes visible to the registry exactly when it commits.
+create table if not exists public.target_origins_version (
+    id integer primary key,
+    version bigint not null default 0
+);
+insert into public.target_origins_version (id, version) values (1, 0) on conflict (id) do nothing;
+
+create or replace function public.bump_target_origins_version() returns trigger as $$
+begin
+    update public.target_origins_version set version = version + 1 where id = 1;
+    return null;
+end;
+$$ language plpgsql;
+
+drop trigger if exists target_origins_version_bump on public.target_origins;
+create trigger target_origins_version_bump
+    after insert or update or delete or truncate on public.target_origins
+    for each statement execute function public.bump_target_origins_version();
@@ -0,0 +1,103 @@
+from datetime import timedelta
+from types import SimpleNamespace
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from app.services import origin_registry as registry_module
+from app.services.origin_registry import OriginRegistry
+
+def make_origin(origin_id: int, scrap_interval: int = 5, enabled: bool = True):
+    return SimpleNamespace(id=origin_id, name=f"Origin {origin_id}", scrap_interval=scrap_interval, enabled=enabled)
+
+async def noop_job(origin_id: int):
+    pass
+
+def job_intervals(scheduler: AsyncIOScheduler):
+    return {job.id: job.trigger.interval for job in scheduler.get_jobs()}
+
+def apply(registry: OriginRegistry, *origins):
+    registry._origins = {origin.id: origin for origin in origins}
+    registry._reconcile()
+
+@pytest.fixture
+def registry():
+    # Never started, so jobs stay pending and nothing actually runs
+    return OriginRegistry(AsyncIOScheduler(), noop_job)
+
+def test_reconcile_adds_jobs_for_enabled_origins(registry):
+    apply(registry, make_origin(1, 5), make_origin(2, 10), make_origin(3, enabled=False))
+
+    assert job_intervals(registry.scheduler) == {
+        "1": timedelta(minutes=5),
+        "2": timedelta(minutes=10),
+    }
+
+def test_reconcile_reschedules_on_interval_change(registry):
+    apply(registry, make_origin(1, 5))
+    apply(registry, make_origin(1, 15))
+
+    assert job_intervals(registry.scheduler) == {"1": timedelta(minutes=15)}
+
+def test_reconcile_removes_disabled_and_deleted_origins(registry):
+    apply(registry, make_origin(1), make_origin(2))
+    apply(registry, make_origin(1, enabled=False))
+
+    assert job_intervals(registry.scheduler) == {}
+
+def test_reconcile_re_adds_re_enabled_origin(registry):
+    apply(registry, make_origin(1, 5))
+    apply(registry, make_origin(1, 5, enabled=False))
+    apply(registry, make_origin(1, 20))
+
+    assert job_intervals(registry.scheduler) == {"1": timedelta(minutes=20)}
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+    def scalars(self):
+        return SimpleNamespace(all=lambda: self.value)
+
+class FakeDatabase:
+    """Stands in for AsyncSessionLocal: answers the version query, then the origins query."""
+    def __init__(self, version, origins):
+        self.version = version
+        self.origins = origins
+        self.origin_loads = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        self._calls = 0
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def execute(self, stmt):
+        self._calls += 1
+        if self._calls == 1:
+            return FakeResult(self.version)
+        self.origin_loads += 1
+        return FakeResult(self.origins)
+
+@pytest.mark.asyncio
+async def test_refresh_skips_reload_when_version_unchanged(registry, monkeypatch):
+    database = FakeDatabase(version=1, origins=[make_origin(1)])
+    monkeypatch.setattr(registry_module, "AsyncSessionLocal", database)
+
+    assert await registry.refresh() is True
+    assert await registry.refresh() is False
+    assert database.origin_loads == 1
+
+    assert await registry.refresh(force=True) is True
+    assert database.origin_loads == 2
+
+    database.version = 2
+    database.origins = [make_origin(1, 30)]
+    assert await registry.refresh() is True
+    assert job_intervals(registry.scheduler) == {"1": timedelta(minutes=30)}
+    assert registry.get(1).scrap_interval == 30
@@ -0,0 +1,222 @@
+import asyncio
+from collections import defaultdict
+from datetime import date
+import pytest
+import pytest_asyncio
+from app.services.scrape_queue import ScrapeQueue
+
+pytestmark = pytest.mark.asyncio
+
+class Origin:
+    def __init__(self, origin_id: int, name: str | None = None):
+        self.id = origin_id
+        self.code = f"origin-{origin_id}"
+        self.name = name or f"Origin {origin_id}"
+        self.enabled = True
+
+class StubScraperService:
+    """Records calls and tracks how many runs are active per origin."""
+    def __init__(self, pages: int = 3, fail: bool = False):
+        self.pages = pages
+        self.fail = fail
+        self.calls = []
+        self.seen_origins = []
+        self.active = defaultdict(int)
+        self.max_active = defaultdict(int)
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def _run(self, origin, call):
+        self.calls.append(call)
+        self.seen_origins.append(origin)
+        self.active[origin.id] += 1
+        self.max_active[origin.id] = max(self.max_active[origin.id], self.active[origin.id])
+        try:
+            await self.gate.wait()
+            await asyncio.sleep(0)
+            if self.fail:
+                raise RuntimeError("boom")
+        finally:
+            self.active[origin.id] -= 1
+
+    async def scrape(self, origin, db):
+        await self._run(origin, ("poll", origin.id))
+        return 1
+
+    async def scrape_range_page(self, origin, page, start_date, end_date, db):
+        await self._run(origin, ("backfill", origin.id, page))
+        return 2, page >= self.pages
+
+async def wait_for_calls(service: StubScraperService, count: int):
+    while len(service.calls) < count:
+        await asyncio.sleep(0)
+
+@pytest_asyncio.fixture
+async def make_queue():
+    queues = []
+
+    def factory(service, workers=1, origins=None):
+        # Unless a registry dict is given, every origin id resolves to a fresh enabled origin
+        lookup = origins.get if origins is not None else Origin
+        queue = ScrapeQueue(service, lookup, workers=workers)
+        queues.append(queue)
+        return queue
+
+    yield factory
+    for queue in queues:
+        await queue.stop()
+
+async def test_poll_goes_ahead_of_remaining_backfill_pages(make_queue):
+    service = StubScraperService(pages=3)
+    queue = make_queue(service)
+    queue.start()
+
+    service.gate.clear()
+    backfill = await queue.submit_backfill(Origin(1), 1, date(2025, 1, 1), date(2025, 12, 31))
+    await wait_for_calls(service, 1)
+
+    poll = await queue.submit_poll(Origin(2))
+    service.gate.set()
+
+    assert await backfill == 6
+    assert await poll == 1
+    assert service.calls == [
+        ("backfill", 1, 1),
+        ("poll", 2),
+        ("backfill", 1, 2),
+        ("backfill", 1, 3),
+    ]
+
+async def test_same_origin_never_runs_concurrently(make_queue):
+    service = StubScraperService(pages=2)
+    queue = make_queue(service, workers=3)
+    queue.start()
+
+    service.gate.clear()
+    origin = Origin(1)
+    first = await queue.submit_poll(origin)
+    await wait_for_calls(service, 1)
+
+    # The running poll already fetched its page, so a new trigger queues one follow-up...
+    follow_up = await queue.submit_poll(origin)
+    assert follow_up is not first
+    # ...and further triggers join that pending follow-up
+    assert await queue.submit_poll(origin) is follow_up
+    backfill = await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31))
+
+    await asyncio.sleep(0.01)
+    assert len(service.calls) == 1
+
+    service.gate.set()
+    await asyncio.gather(first, follow_up, backfill)
+
+    assert service.max_active[1] == 1
+    assert service.calls.count(("poll", 1)) == 2
+
+async def test_identical_backfill_joins_running_backfill(make_queue):
+    service = StubScraperService(pages=2)
+    queue = make_queue(service)
+    queue.start()
+
+    service.gate.clear()
+    origin = Origin(1)
+    first = await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31))
+    await wait_for_calls(service, 1)
+
+    assert await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31)) is first
+    service.gate.set()
+    assert await first == 4
+
+async def test_failed_step_rejects_joined_futures_and_queue_drains(make_queue):
+    service = StubScraperService(fail=True)
+    queue = make_queue(service)
+
+    origin = Origin(1)
+    first = await queue.submit_poll(origin)
+    joined = await queue.submit_poll(origin)
+    assert joined is first
+    backfill = await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31))
+    backfill_joined = await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31))
+    assert backfill_joined is backfill
+
+    queue.start()
+    for future in (first, joined, backfill, backfill_joined):
+        with pytest.raises(RuntimeError, match="boom"):
+            await future
+
+    service.fail = False
+    assert await (await queue.submit_poll(origin)) == 1
+
+    stats = queue.stats()
+    assert stats["depth"] == 0
+    assert stats["running"] == []
+
+async def test_stop_cancels_outstanding_work(make_queue):
+    service = StubScraperService()
+    queue = make_queue(service)
+    queue.start()
+
+    service.gate.clear()
+    running = await queue.submit_poll(Origin(1))
+    await wait_for_calls(service, 1)
+    pending = await queue.submit_poll(Origin(2))
+
+    await queue.stop()
+
+    assert running.cancelled()
+    assert pending.cancelled()
+    assert queue.stats()["depth"] == 0
+
+async def test_cancel_origin_stops_backfill_and_drops_pending_work(make_queue):
+    service = StubScraperService(pages=5)
+    queue = make_queue(service)
+    queue.start()
+
+    service.gate.clear()
+    origin = Origin(1)
+    backfill = await queue.submit_backfill(origin, 1, date(2025, 1, 1), date(2025, 12, 31))
+    await wait_for_calls(service, 1)
+    poll = await queue.submit_poll(origin)
+    other = await queue.submit_poll(Origin(2))
+
+    assert await queue.cancel_origin(1) == 2
+    assert poll.cancelled()
+
+    service.gate.set()
+    with pytest.raises(asyncio.CancelledError):
+        await backfill
+    assert await other == 1
+
+    # The page in flight finished, but no further pages were queued
+    assert service.calls == [("backfill", 1, 1), ("poll", 2)]
+    assert queue.stats()["depth"] == 0
+    # A new trigger after cancellation starts fresh work
+    assert await (await queue.submit_poll(origin)) == 1
+
+async def test_steps_use_current_origin_from_registry(make_queue):
+    service = StubScraperService(pages=2)
+    origins = {1: Origin(1, "before")}
+    queue = make_queue(service, origins=origins)
+
+    poll = await queue.submit_poll(origins[1])
+    backfill = await queue.submit_backfill(origins[1], 1, date(2025, 1, 1), date(2025, 12, 31))
+    origins[1] = Origin(1, "after")
+
+    queue.start()
+    await asyncio.gather(poll, backfill)
+    assert [origin.name for origin in service.seen_origins] == ["after", "after", "after"]
+
+async def test_disabled_origin_stops_at_next_step(make_queue):
+    service = StubScraperService(pages=5)
+    origins = {1: Origin(1)}
+    queue = make_queue(service, origins=origins)
+    queue.start()
+
+    service.gate.clear()
+    backfill = await queue.submit_backfill(origins[1], 1, date(2025, 1, 1), date(2025, 12, 31))
+    await wait_for_calls(service, 1)
+    origins[1].enabled = False
+    service.gate.set()
+
+    assert await backfill == 2
+    assert service.calls == [("backfill", 1, 1)]
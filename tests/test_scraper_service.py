@@ -0,0 +1,113 @@
+from datetime import date
+from types import SimpleNamespace
+import pytest
+from app.models.origin import ScraperType
+from app.services.scraper_service import ScraperService
+
+pytestmark = pytest.mark.asyncio
+
+TARGET_URL = "https://www.uos.ac.kr/korNotice/list.do?list_id=FA1&identified=anonymous"
+
+def list_html(*rows) -> str:
+    """CommonScraper list page with one row per (seq, written date) pair, newest first."""
+    items = "".join(
+        f"""
+        <li>
+            <p class="num">{seq}</p>
+            <div class="ti"><a href="javascript:fnView('1', '{seq}');">제목 {seq}</a></div>
+            <div class="da"><span>작성자</span><span>{written}</span><span>0</span></div>
+        </li>"""
+        for seq, written in rows
+    )
+    return f'<div class="content-area"><div id="contents"><ul class="brd-lstp1">{items}</ul></div></div>'
+
+class FakeClient:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    async def get(self, url: str, **kwargs):
+        self.requested.append(url)
+        page = int(url.rsplit("pageIndex=", 1)[1])
+        return SimpleNamespace(text=self.pages.get(page, list_html()), raise_for_status=lambda: None)
+
+@pytest.fixture
+def origin():
+    return SimpleNamespace(
+        id=1,
+        code="uos.main.fa1",
+        name="일반",
+        target_url=TARGET_URL,
+        scraper_type=ScraperType.COMMON,
+    )
+
+@pytest.fixture
+def service(monkeypatch):
+    service = ScraperService()
+    service.saved = []
+
+    async def record(origin, item, scraper, db):
+        service.saved.append(item.id)
+
+    monkeypatch.setattr(service, "_process_and_save_item", record)
+    return service
+
+async def test_range_page_skips_newer_and_continues(service, origin):
+    service.client = FakeClient({1: list_html(("3", "2025.11.30"), ("2", "2025.11.20"), ("1", "2025.11.10"))})
+
+    count, done = await service.scrape_range_page(origin, 1, date(2025, 11, 1), date(2025, 11, 25), db=None)
+
+    assert (count, done) == (2, False)
+    assert service.saved == ["2", "1"]
+
+async def test_range_page_stops_at_item_older_than_start(service, origin):
+    service.client = FakeClient({2: list_html(("3", "2025.11.20"), ("2", "2025.10.31"), ("1", "2025.11.15"))})
+
+    count, done = await service.scrape_range_page(origin, 2, date(2025, 11, 1), date(2025, 11, 30), db=None)
+
+    assert (count, done) == (1, True)
+    assert service.saved == ["3"]
+    assert service.client.requested == [f"{TARGET_URL}&pageIndex=2"]
+
+async def test_range_page_stops_on_empty_page(service, origin):
+    service.client = FakeClient({})
+
+    assert await service.scrape_range_page(origin, 7, date(2025, 1, 1), date(2025, 12, 31), db=None) == (0, True)
+    assert service.saved == []
+
+async def test_range_page_with_only_newer_items_is_not_done(service, origin):
+    service.client = FakeClient({1: list_html(("2", "2025.12.02"), ("1", "2025.12.01"))})
+
+    assert await service.scrape_range_page(origin, 1, date(2025, 11, 1), date(2025, 11, 30), db=None) == (0, False)
+
+async def test_poll_scrapes_first_page_only(service, origin):
+    service.client = FakeClient({
+        1: list_html(("2", "2025.11.20"), ("1", "2025.11.10")),
+        2: list_html(("0", "2025.11.01")),
+    })
+
+    assert await service.scrape(origin, db=None) == 2
+    assert service.saved == ["2", "1"]
+    assert service.client.requested == [f"{TARGET_URL}&pageIndex=1"]
+
+async def test_list_dom_released_before_detail_fetches(service, origin, monkeypatch):
+    service.client = FakeClient({1: list_html(("2", "2025.11.20"), ("1", "2025.11.10"))})
+    scraper = service.scrapers[ScraperType.COMMON]
+    generators = []
+    parse_list = scraper.parse_list
+
+    def tracking_parse_list(html, base_url):
+        generator = parse_list(html, base_url)
+        generators.append(generator)
+        return generator
+
+    async def record(origin, item, scraper, db):
+        # A finished generator drops its frame, and with it the BeautifulSoup tree
+        assert generators[0].gi_frame is None
+        service.saved.append(item.id)
+
+    monkeypatch.setattr(scraper, "parse_list", tracking_parse_list)
+    monkeypatch.setattr(service, "_process_and_save_item", record)
+
+    assert await service.scrape_range_page(origin, 1, date(2025, 11, 15), date(2025, 11, 30), db=None) == (1, True)
+    assert service.saved == ["2"]